@@ -5,27 +5,55 @@ from src.parser import Parser
 from src.tokenizer import tokenize
 from src.interpreter import Interpreter
 from src.environment import Environment
+from src.ast_nodes import Program
+
+
+def _parse_one(path: str) -> Program:
+    """
+    Read, tokenize and parse a single source file.
+
+    Parameters:
+        path (str): The path of the file to parse.
+    Returns:
+        Program: The AST for the file.
+    """
+    with open(path) as f:
+        code = f.read()
+
+    tokens = tokenize(code)
+    parser = Parser(tokens, filename=path)
+    return parser.parse()
+
+
+def parse_files(paths: List[str]) -> Program:
+    """
+    Parse several source files in order and combine them into one program.
+
+    Parameters:
+        paths (List[str]): The paths of the files to parse.
+    Returns:
+        Program: A single AST holding the statements of every file in order.
+    """
+    statements = []
+    for path in paths:
+        statements.extend(_parse_one(path).statements)
+    return Program(statements)
 
 
 def main() -> None:
     """
     Main entry point for the HandyLang interpreter.
-    
-    Parses command-line arguments, reads the source file,
-    tokenizes, parses, and interprets the code.
+
+    Parses command-line arguments, reads the source files,
+    tokenizes and parses them, and interprets the combined code.
     """
-    if len(sys.argv) != 2:
-        print("Usage: python3 handy.py <file.hdy>")
+    if len(sys.argv) < 2:
+        print("Usage: python3 handy.py <file.hdy> [<file.hdy> ...]")
         sys.exit(1)
 
-    path = sys.argv[1]
+    paths = sys.argv[1:]
     try:
-        with open(path) as f:
-            code = f.read()
-
-        tokens = tokenize(code)
-        parser = Parser(tokens, filename=path)
-        ast = parser.parse()
+        ast = parse_files(paths)
 
         env = Environment()
         interp = Interpreter(env)
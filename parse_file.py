@@ -5,6 +5,7 @@ from typing import Any, List, Dict, Optional, Union
 
 from src.tokenizer import tokenize
 from src.parser import Parser
+from src.ast_nodes import Node
 
 
 def main() -> None:
@@ -42,22 +43,49 @@ def main() -> None:
 def print_ast(node: Any, indent: int = 0) -> None:
     """
     Simple AST printer for debugging.
-    
+
+    The tree is walked with an explicit stack rather than by recursion, so
+    deeply nested programs cannot hit the recursion limit.
+
     Parameters:
         node (Any): The AST node to print.
         indent (int): The current indentation level.
     """
-    pad = "  " * indent
-    if isinstance(node, list):
-        for item in node:
-            print_ast(item, indent)
-    elif hasattr(node, '__dict__'):
-        print(f"{pad}{node.__class__.__name__}:")
-        for k, v in node.__dict__.items():
-            print(f"{pad}  {k}:")
-            print_ast(v, indent + 2)
-    else:
-        print(f"{pad}{node}")
+    stack = [(node, indent)]
+    while stack:
+        node, indent = stack.pop()
+        pad = "  " * indent
+        if isinstance(node, list):
+            # Pushed in reverse so the items are printed in order
+            stack.extend((item, indent) for item in reversed(node))
+        elif isinstance(node, Node):
+            print(f"{pad}{node.__class__.__name__}:")
+            children = []
+            for k in node_fields(node):
+                # A field label is a plain string printed one level deeper
+                children.append((f"{k}:", indent + 1))
+                children.append((getattr(node, k), indent + 2))
+            stack.extend(reversed(children))
+        else:
+            print(f"{pad}{node}")
+
+
+def node_fields(node: Node) -> List[str]:
+    """
+    Collect the field names of an AST node.
+
+    AST nodes use __slots__ and have no __dict__, so the fields are gathered
+    from the __slots__ of every class in the MRO, base classes first.
+
+    Parameters:
+        node (Node): The AST node to inspect.
+    Returns:
+        List[str]: The node's field names in declaration order.
+    """
+    fields: List[str] = []
+    for cls in reversed(type(node).__mro__):
+        fields.extend(getattr(cls, '__slots__', ()))
+    return fields
 
 
 if __name__ == "__main__":
@@ -4,6 +4,13 @@ setup(
     name="handylang",
     version="0.1.0",
     packages=find_packages(),
+    py_modules=["handy", "parse_file"],
+    entry_points={
+        "console_scripts": [
+            "handy=handy:main",
+            "handy-parse=parse_file:main",
+        ],
+    },
     install_requires=[],
     python_requires=">=3.6",
 )
@@ -1,14 +1,22 @@
 class Node:
     """Base class for all AST nodes."""
-    pass
+    # Nodes are constructed directly rather than recycled through per-class
+    # free lists: small-object allocation already goes through pymalloc, and
+    # a Python-level pool measured slower than a plain slotted constructor
+    # call.
+    __slots__ = ()
 
 
 class Program(Node):
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements
 
 
 class VarDecl(Node):
+    __slots__ = ('name', 'type_', 'value')
+
     def __init__(self, name, type_, value):
         self.name = name
         # Can be None
@@ -18,6 +26,8 @@ class VarDecl(Node):
 
 
 class ConstDecl(Node):
+    __slots__ = ('name', 'type_', 'value')
+
     def __init__(self, name, type_, value):
         self.name = name
         self.type_ = type_
@@ -25,6 +35,8 @@ class ConstDecl(Node):
 
 
 class FunctionDef(Node):
+    __slots__ = ('name', 'params', 'return_type', 'body')
+
     def __init__(self, name, params, return_type, body):
         self.name = name
         self.params = params
@@ -34,6 +46,8 @@ class FunctionDef(Node):
 
 
 class Param(Node):
+    __slots__ = ('name', 'type_', 'default')
+
     def __init__(self, name, type_, default):
         self.name = name
         self.type_ = type_
@@ -41,11 +55,15 @@ class Param(Node):
 
 
 class Block(Node):
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements
 
 
 class IfStmt(Node):
+    __slots__ = ('condition', 'then_block', 'else_block')
+
     def __init__(self, condition, then_block, else_block):
         self.condition = condition
         self.then_block = then_block
@@ -54,6 +72,8 @@ class IfStmt(Node):
 
 
 class ForStmt(Node):
+    __slots__ = ('var_name', 'iterable', 'body')
+
     def __init__(self, var_name, iterable, body):
         self.var_name = var_name
         self.iterable = iterable
@@ -61,6 +81,8 @@ class ForStmt(Node):
 
 
 class MatchStmt(Node):
+    __slots__ = ('expr', 'cases', 'else_block')
+
     def __init__(self, expr, cases, else_block):
         self.expr = expr
         # List of (case_value, case_block)
@@ -70,6 +92,8 @@ class MatchStmt(Node):
 
 
 class FunctionCall(Node):
+    __slots__ = ('name', 'args')
+
     def __init__(self, name, args):
         self.name = name
         # List of expressions
@@ -77,17 +101,23 @@ class FunctionCall(Node):
 
 
 class ReturnStmt(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
 
 class RaiseStmt(Node):
+    __slots__ = ('exception_type', 'message')
+
     def __init__(self, exception_type, message):
         self.exception_type = exception_type
         self.message = message
 
 
 class TryStmt(Node):
+    __slots__ = ('try_block', 'except_blocks')
+
     def __init__(self, try_block, except_blocks):
         self.try_block = try_block
         # List of (exception_type(s), block)
@@ -95,6 +125,8 @@ class TryStmt(Node):
 
 
 class Expression(Node):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
@@ -102,22 +134,30 @@ class Expression(Node):
 
 
 class Literal(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
 
 class Identifier(Node):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
 
 class CodeBlock(Node):
+    __slots__ = ('params', 'body')
+
     def __init__(self, params, body):
         self.params = params  # List of Param
         self.body = body
 
 
 class MacroDef(Node):
+    __slots__ = ('name', 'params', 'body')
+
     def __init__(self, name, params, body):
         self.name = name
         self.params = params
@@ -125,6 +165,8 @@ class MacroDef(Node):
 
 
 class ComptimeDef(Node):
+    __slots__ = ('name', 'params', 'body')
+
     def __init__(self, name, params, body):
         self.name = name
         self.params = params
@@ -132,6 +174,8 @@ class ComptimeDef(Node):
 
 
 class TypeDef(Node):
+    __slots__ = ('name', 'base_type', 'fields', 'methods')
+
     def __init__(self, name, base_type, fields, methods):
         self.name = name
         self.base_type = base_type  # Can be None
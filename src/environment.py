@@ -1,24 +1,31 @@
 class Environment:
+    __slots__ = ('vars', 'consts', '_all')
+
+
     def __init__(self):
         # name -> value
         self.vars = {}
         # name -> value
         self.consts = {}
+        # name -> value for both of the above, so a read is one dict probe.
+        # Variables shadow constants of the same name, as before.
+        self._all = {}
 
 
     def set_var(self, name, value):
         self.vars[name] = value
+        self._all[name] = value
 
 
     def get_var(self, name):
-        if name in self.vars:
-            return self.vars[name]
-        if name in self.consts:
-            return self.consts[name]
-        raise NameError(f"Variable '{name}' not defined")
+        try:
+            return self._all[name]
+        except KeyError:
+            raise NameError(f"Variable '{name}' not defined") from None
 
 
     def set_const(self, name, value):
         if name in self.consts:
             raise ValueError(f"Constant '{name}' already defined")
         self.consts[name] = value
+        self._all.setdefault(name, value)
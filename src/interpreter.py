@@ -1,9 +1,23 @@
+import sys
+
 from src.ast_nodes import *
 
 
 class Interpreter:
+    # Fixed attributes: reads go through slot descriptors, not an instance dict
+    __slots__ = ('env', '_dispatch')
+
+
     def __init__(self, environment):
         self.env = environment
+        # node type -> handler, so eval() costs one dict lookup per node
+        self._dispatch = {
+            VarDecl: self._eval_var_decl,
+            ConstDecl: self._eval_const_decl,
+            FunctionCall: self._eval_call,
+            Literal: self._eval_literal,
+            Identifier: self._eval_ident,
+        }
 
 
     def run(self, program):
@@ -12,34 +26,41 @@ class Interpreter:
 
 
     def eval(self, node):
-        if isinstance(node, VarDecl):
-            value = self.eval(node.value) if node.value else self.default_value(node.type_)
-            self.env.set_var(node.name, value)
-        elif isinstance(node, ConstDecl):
-            value = self.eval(node.value)
-            self.env.set_const(node.name, value)
-        elif isinstance(node, FunctionCall):
-            if node.name == "print":
-                for arg in node.args:
-                    val = self.eval(arg)
-                    print(val)
-            else:
-                raise NotImplementedError(f"Function '{node.name}' not implemented")
-        elif isinstance(node, Literal):
-            return self.parse_literal_value(node.value)
-        elif isinstance(node, Identifier):
-            return self.env.get_var(node.name)
-        else:
+        handler = self._dispatch.get(type(node))
+        if handler is None:
             raise NotImplementedError(f"Node type {type(node)} not implemented yet")
+        return handler(node)
+
+
+    def _eval_var_decl(self, node):
+        value = self.eval(node.value) if node.value else self.default_value(node.type_)
+        self.env.set_var(node.name, value)
+
+
+    def _eval_const_decl(self, node):
+        value = self.eval(node.value)
+        self.env.set_const(node.name, value)
+
+
+    def _eval_call(self, node):
+        if node.name == "print":
+            # Each argument still goes on its own line, written in one call.
+            # sys.stdout is looked up each time, as print() does, so
+            # redirect_stdout() and other replacements of it are honoured
+            vals = [self.eval(arg) for arg in node.args]
+            if vals:
+                sys.stdout.write('\n'.join(map(str, vals)) + '\n')
+        else:
+            raise NotImplementedError(f"Function '{node.name}' not implemented")
+
+
+    def _eval_literal(self, node):
+        # The parser has already converted the literal to a Python value
+        return node.value
 
 
-    def parse_literal_value(self, value):
-        # Convert string representations to actual Python types
-        if value.startswith('"') and value.endswith('"'):
-            return value[1:-1]
-        if "." in value:
-            return float(value)
-        return int(value)
+    def _eval_ident(self, node):
+        return self.env.get_var(node.name)
 
 
     def default_value(self, type_):
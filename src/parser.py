@@ -1,104 +1,177 @@
-from typing import List, Dict, Optional, Any, Tuple, Union
+from typing import List, Dict, Optional, Any, Tuple, Union, Callable
 
 from src.ast_nodes import *
+from src.tokenizer import (
+    Tokens, KIND_NAMES, KEYWORD, IDENT, NUMBER, STRING, ASSIGN, ARROW, COLON,
+    COMMA, LPAREN, RPAREN, LBRACE, RBRACE,
+)
+
+# Escape sequences understood in string literals
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', '0': '\0', '"': '"', '\\': '\\'}
+
+
+def _unescape(text: str) -> str:
+    """
+    Resolve the backslash escape sequences in the body of a string literal.
+
+    Unknown escapes are kept verbatim, backslash included.
+
+    Parameters:
+        text (str): The string literal without its surrounding quotes.
+    Returns:
+        str: The string value the literal denotes.
+    """
+    if '\\' not in text:
+        return text
+    parts = []
+    pos = 0
+    while True:
+        escape = text.find('\\', pos)
+        if escape < 0 or escape + 1 >= len(text):
+            parts.append(text[pos:])
+            return ''.join(parts)
+        parts.append(text[pos:escape])
+        char = text[escape + 1]
+        parts.append(_ESCAPES.get(char, '\\' + char))
+        pos = escape + 2
+
+
+class ParseError(SyntaxError):
+    """
+    A syntax error found by the parser.
+
+    Only the message and the offending token's position are stored when the
+    error is raised. The full report (file, line, column, the source line and
+    a caret under the token) is assembled by __str__, so an error that is
+    caught and discarded never pays for formatting.
+    """
+    # filename is already a SyntaxError attribute
+    __slots__ = ('tokens', 'index')
+
+    def __init__(self, message: str, filename: str, tokens: Optional[Tokens] = None, index: int = 0):
+        """
+        Initialize a parse error.
+
+        Parameters:
+            message (str): What went wrong.
+            filename (str): The name of the file being parsed.
+            tokens (Optional[Tokens]): The token stream, or None if there is no token to point at.
+            index (int): The position of the offending token in the stream.
+        """
+        super().__init__(message)
+        self.filename = filename
+        self.tokens = tokens
+        self.index = index
+
+    def __reduce__(self):
+        # Rebuild from the constructor's arguments so the error can be pickled
+        return type(self), (self.msg, self.filename, self.tokens, self.index)
+
+    def __str__(self) -> str:
+        if self.tokens is None:
+            return f"{self.filename}: {self.msg}"
+
+        line, col = self.tokens.location(self.index)
+        line_text = self.tokens.line_text(line)
+
+        # Format the error message with file, line, column and code context
+        error_msg = f"{self.filename}:{line}:{col}: {self.msg}"
+
+        if line_text:
+            # Add the line of code
+            error_msg += f"\n\n{line}: {line_text}\n"
+
+            # Add a pointer to the problematic token: skip the "line: " prefix,
+            # then the col - 1 characters before the token, in one padding string
+            error_msg += " " * (len(str(line)) + 1 + col) + "^"
+
+        return error_msg
 
 
 class Parser:
-    def __init__(self, tokens: List[Dict[str, Any]], filename: str):
+    def __init__(self, tokens: Tokens, filename: str):
         """
         Initialize a new Parser instance.
         
         Parameters:
-            tokens (List[Dict[str, Any]]): List of token dictionaries from the tokenizer.
+            tokens (Tokens): The token stream from the tokenizer.
             filename (str): The name of the file being parsed.
         """
         self.tokens = tokens
+        # The parser works directly on the token columns
+        self.kinds = tokens.kinds
+        self.values = tokens.values
         self.pos = 0
         self.filename = filename
 
-    def peek(self) -> Dict[str, Any]:
+    def peek(self) -> Optional[int]:
         """
-        Look at the current token without advancing.
+        Look at the kind of the current token without advancing.
         
         Returns:
-            Dict[str, Any]: The current token or {'type': None, 'value': None} if at end of tokens.
+            Optional[int]: The current token's kind, or None if at end of tokens.
         """
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        return {'type': None, 'value': None}
+        if self.pos < len(self.kinds):
+            return self.kinds[self.pos]
+        return None
 
-    def advance(self) -> Dict[str, Any]:
+    def advance(self) -> Tuple[Optional[int], Optional[str]]:
         """
         Get the current token and advance to the next one.
         
         Returns:
-            Dict[str, Any]: The current token.
+            Tuple[Optional[int], Optional[str]]: The current token's kind and value,
+            or (None, None) if at end of tokens.
         """
-        token = self.peek()
-        self.pos += 1
-        return token
+        pos = self.pos
+        self.pos = pos + 1
+        if pos < len(self.kinds):
+            return self.kinds[pos], self.values[pos]
+        return None, None
 
-    def expect(self, kind: str, value: Optional[str] = None) -> Dict[str, Any]:
+    def expect(self, kind: int, value: Optional[str] = None) -> str:
         """
         Expect a token of a specific kind and optionally with a specific value.
         Raises a SyntaxError if the expectation is not met.
         
         Parameters:
-            kind (str): The expected token type.
+            kind (int): The expected token kind.
             value (Optional[str]): The expected token value, if any.
             
         Returns:
-            Dict[str, Any]: The token if it matches the expectation.
+            str: The value of the token if it matches the expectation.
         Raises:
             SyntaxError: If the token doesn't match the expectation.
         """
-        token = self.advance()
-        if token['type'] != kind or (value is not None and token['value'] != value):
-            expected = f"{kind}"
+        actual_kind, actual_value = self.advance()
+        if actual_kind != kind or (value is not None and actual_value != value):
+            expected = f"{KIND_NAMES[kind]}"
             if value:
                 expected += f" with value '{value}'"
-            actual = f"{token['type']}"
-            if 'value' in token:
-                actual += f" with value '{token['value']}'"
+            actual = f"{KIND_NAMES.get(actual_kind)} with value '{actual_value}'"
             self._report_error(f"Expected {expected}, got {actual}")
-        return token
+        return actual_value
 
     def _report_error(self, message: str) -> None:
         """
-        Report a syntax error with context information.
+        Report a syntax error at the current token.
         
         Parameters:
             message (str): The error message.
         Raises:
-            SyntaxError: Always raised with contextual information.
+            ParseError: Always raised; it formats the contextual information when shown.
         """
         # Get the current token or the previous one if we've advanced too far
-        if self.pos >= len(self.tokens) and self.pos > 0:
-            token = self.tokens[self.pos - 1]
-        elif self.pos < len(self.tokens):
-            token = self.tokens[self.pos]
+        count = len(self.kinds)
+        if self.pos >= count and self.pos > 0:
+            index = count - 1
+        elif self.pos < count:
+            index = self.pos
         else:
             # No tokens available
-            raise SyntaxError(f"{self.filename}: {message}")
-        
-        line = token.get('line', 0)
-        col = token.get('col', 0)
-        line_text = token.get('line_text', '')
-        
-        # Format the error message with file, line, column and code context
-        error_msg = f"{self.filename}:{line}:{col}: {message}"
-        
-        if line_text:
-            # Add the line of code
-            error_msg += f"\n\n{line}: {line_text}\n"
-            
-            # Add a pointer to the problematic token
-            pointer = " " * (len(str(line)) + 2)  # Account for "line: " prefix
-            pointer += " " * (col - 1)  # Position the caret under the token
-            pointer += "^"
-            error_msg += pointer
-            
-        raise SyntaxError(error_msg)
+            raise ParseError(message, self.filename)
+
+        raise ParseError(message, self.filename, self.tokens, index)
 
     def parse(self) -> Program:
         """
@@ -108,9 +181,13 @@ class Parser:
             Program: The AST for the entire program.
         """
         try:
-            statements = []
-            while self.peek()['type']:
-                statements.append(self.parse_statement())
+            statements: List[Any] = []
+            # Bound once; the list method is otherwise looked up per statement
+            append = statements.append
+            peek = self.peek
+            parse_statement = self.parse_statement
+            while peek():
+                append(parse_statement())
             return Program(statements)
         except Exception as e:
             if not isinstance(e, SyntaxError):
@@ -126,35 +203,11 @@ class Parser:
         Raises:
             SyntaxError: If the statement cannot be parsed.
         """
-        try:
-            token = self.peek()
-            kind, value = token['type'], token['value']
-            
-            if kind == 'KEYWORD':
-                if value == 'var':
-                    return self.parse_var_decl()
-                elif value == 'const':
-                    return self.parse_const_decl()
-                elif value == 'def':
-                    return self.parse_function_def()
-                elif value == 'if':
-                    return self.parse_if_stmt()
-                elif value == 'for':
-                    return self.parse_for_stmt()
-                elif value == 'match':
-                    return self.parse_match_stmt()
-                elif value == 'return':
-                    return self.parse_return_stmt()
-                elif value == 'raise':
-                    return self.parse_raise_stmt()
-                elif value == 'print':
-                    return self.parse_print_statement()
-                # add more as needed
-            return self.parse_expression()
-        except Exception as e:
-            if not isinstance(e, SyntaxError):
-                self._report_error(f"Error parsing statement: {str(e)}")
-            raise
+        if self.peek() == KEYWORD:
+            rule = _STMT_DISPATCH.get(self.values[self.pos])
+            if rule is not None:
+                return rule(self)
+        return self.parse_expression()
 
     def parse_var_decl(self) -> VarDecl:
         """
@@ -165,22 +218,17 @@ class Parser:
         Raises:
             SyntaxError: If the variable declaration cannot be parsed.
         """
-        try:
-            self.expect('KEYWORD', 'var')
-            name = self.expect('IDENT')['value']
-            type_ = None
-            if self.peek()['type'] == 'COLON':
-                self.advance()
-                type_ = self.expect('KEYWORD')['value']
-            value = None
-            if self.peek()['type'] == 'ASSIGN':
-                self.advance()
-                value = self.parse_expression()
-            return VarDecl(name, type_, value)
-        except Exception as e:
-            if not isinstance(e, SyntaxError):
-                self._report_error(f"Error parsing variable declaration: {str(e)}")
-            raise
+        self.expect(KEYWORD, 'var')
+        name = self.expect(IDENT)
+        type_ = None
+        if self.peek() == COLON:
+            self.advance()
+            type_ = self.expect(KEYWORD)
+        value = None
+        if self.peek() == ASSIGN:
+            self.advance()
+            value = self.parse_expression()
+        return VarDecl(name, type_, value)
 
     def parse_const_decl(self) -> ConstDecl:
         """
@@ -191,20 +239,15 @@ class Parser:
         Raises:
             SyntaxError: If the constant declaration cannot be parsed.
         """
-        try:
-            self.expect('KEYWORD', 'const')
-            name = self.expect('IDENT')['value']
-            type_ = None
-            if self.peek()['type'] == 'COLON':
-                self.advance()
-                type_ = self.expect('KEYWORD')['value']
-            self.expect('ASSIGN')
-            value = self.parse_expression()
-            return ConstDecl(name, type_, value)
-        except Exception as e:
-            if not isinstance(e, SyntaxError):
-                self._report_error(f"Error parsing constant declaration: {str(e)}")
-            raise
+        self.expect(KEYWORD, 'const')
+        name = self.expect(IDENT)
+        type_ = None
+        if self.peek() == COLON:
+            self.advance()
+            type_ = self.expect(KEYWORD)
+        self.expect(ASSIGN)
+        value = self.parse_expression()
+        return ConstDecl(name, type_, value)
 
     def parse_function_def(self) -> FunctionDef:
         """
@@ -215,22 +258,17 @@ class Parser:
         Raises:
             SyntaxError: If the function definition cannot be parsed.
         """
-        try:
-            self.expect('KEYWORD', 'def')
-            name = self.expect('IDENT')['value']
-            self.expect('LPAREN')
-            params = self.parse_param_list()
-            self.expect('RPAREN')
-            return_type = None
-            if self.peek()['type'] == 'ARROW':
-                self.advance()
-                return_type = self.expect('KEYWORD')['value']
-            body = self.parse_block()
-            return FunctionDef(name, params, return_type, body)
-        except Exception as e:
-            if not isinstance(e, SyntaxError):
-                self._report_error(f"Error parsing function definition: {str(e)}")
-            raise
+        self.expect(KEYWORD, 'def')
+        name = self.expect(IDENT)
+        self.expect(LPAREN)
+        params = self.parse_param_list()
+        self.expect(RPAREN)
+        return_type = None
+        if self.peek() == ARROW:
+            self.advance()
+            return_type = self.expect(KEYWORD)
+        body = self.parse_block()
+        return FunctionDef(name, params, return_type, body)
 
     def parse_param_list(self) -> List[Param]:
         """
@@ -241,26 +279,26 @@ class Parser:
         Raises:
             SyntaxError: If the parameter list cannot be parsed.
         """
-        try:
-            params = []
-            while self.peek()['type'] != 'RPAREN':
-                pname = self.expect('IDENT')['value']
-                ptype = None
-                if self.peek()['type'] == 'COLON':
-                    self.advance()
-                    ptype = self.expect('KEYWORD')['value']
-                default = None
-                if self.peek()['type'] == 'ASSIGN':
-                    self.advance()
-                    default = self.parse_expression()
-                params.append(Param(pname, ptype, default))
-                if self.peek()['type'] == 'COMMA':
-                    self.advance()
-            return params
-        except Exception as e:
-            if not isinstance(e, SyntaxError):
-                self._report_error(f"Error parsing parameter list: {str(e)}")
-            raise
+        params: List[Param] = []
+        append = params.append
+        # The bound methods are looked up once rather than on every check
+        peek = self.peek
+        advance = self.advance
+        expect = self.expect
+        while peek() not in (RPAREN, None):
+            pname = expect(IDENT)
+            ptype = None
+            if peek() == COLON:
+                advance()
+                ptype = expect(KEYWORD)
+            default = None
+            if peek() == ASSIGN:
+                advance()
+                default = self.parse_expression()
+            append(Param(pname, ptype, default))
+            if peek() == COMMA:
+                advance()
+        return params
 
     def parse_block(self) -> Block:
         """
@@ -271,17 +309,15 @@ class Parser:
         Raises:
             SyntaxError: If the block cannot be parsed.
         """
-        try:
-            self.expect('LBRACE')
-            statements = []
-            while self.peek()['type'] != 'RBRACE':
-                statements.append(self.parse_statement())
-            self.expect('RBRACE')
-            return Block(statements)
-        except Exception as e:
-            if not isinstance(e, SyntaxError):
-                self._report_error(f"Error parsing code block: {str(e)}")
-            raise
+        self.expect(LBRACE)
+        statements: List[Any] = []
+        append = statements.append
+        peek = self.peek
+        parse_statement = self.parse_statement
+        while peek() not in (RBRACE, None):
+            append(parse_statement())
+        self.expect(RBRACE)
+        return Block(statements)
 
     def parse_expression(self) -> Union[Literal, Identifier]:
         """
@@ -293,24 +329,19 @@ class Parser:
         Raises:
             SyntaxError: If the expression cannot be parsed.
         """
-        try:
-            # Simplified placeholder
-            token = self.advance()
-            kind = token['type']
-            value = token['value']
-            
-            if kind == 'NUMBER':
-                return Literal(value)
-            elif kind == 'STRING':
-                return Literal(value)
-            elif kind == 'IDENT':
-                return Identifier(value)
-            else:
-                self._report_error(f"Unexpected token in expression: {kind} with value '{value}'")
-        except Exception as e:
-            if not isinstance(e, SyntaxError):
-                self._report_error(f"Error parsing expression: {str(e)}")
-            raise
+        # Simplified placeholder
+        kind, value = self.advance()
+        
+        # Literal values are converted once here so the interpreter
+        # never has to look at the source text again
+        if kind == NUMBER:
+            return Literal(float(value) if '.' in value else int(value))
+        elif kind == STRING:
+            return Literal(_unescape(value[1:-1]))
+        elif kind == IDENT:
+            return Identifier(value)
+        else:
+            self._report_error(f"Unexpected token in expression: {KIND_NAMES.get(kind)} with value '{value}'")
 
     def parse_print_statement(self) -> FunctionCall:
         """
@@ -321,20 +352,18 @@ class Parser:
         Raises:
             SyntaxError: If the print statement cannot be parsed.
         """
-        try:
-            self.expect('KEYWORD', 'print')
-            self.expect('LPAREN')
-            args = []
-            while self.peek()['type'] != 'RPAREN':
-                args.append(self.parse_expression())
-                if self.peek()['type'] == 'COMMA':
-                    self.advance()
-            self.expect('RPAREN')
-            return FunctionCall('print', args)
-        except Exception as e:
-            if not isinstance(e, SyntaxError):
-                self._report_error(f"Error parsing print statement: {str(e)}")
-            raise
+        self.expect(KEYWORD, 'print')
+        self.expect(LPAREN)
+        args: List[Union[Literal, Identifier]] = []
+        append = args.append
+        peek = self.peek
+        parse_expression = self.parse_expression
+        while peek() not in (RPAREN, None):
+            append(parse_expression())
+            if peek() == COMMA:
+                self.advance()
+        self.expect(RPAREN)
+        return FunctionCall('print', args)
             
     # Placeholder methods to be implemented
     def parse_if_stmt(self):
@@ -356,3 +385,17 @@ class Parser:
     def parse_raise_stmt(self):
         """Placeholder for raise statement parsing"""
         self._report_error("Raise statement parsing not yet implemented")
+
+
+# Statement keyword -> parse rule; add more as needed
+_STMT_DISPATCH: Dict[str, Callable[[Parser], Any]] = {
+    'var': Parser.parse_var_decl,
+    'const': Parser.parse_const_decl,
+    'def': Parser.parse_function_def,
+    'if': Parser.parse_if_stmt,
+    'for': Parser.parse_for_stmt,
+    'match': Parser.parse_match_stmt,
+    'return': Parser.parse_return_stmt,
+    'raise': Parser.parse_raise_stmt,
+    'print': Parser.parse_print_statement,
+}
@@ -1,151 +1,317 @@
 import re
-from typing import List, Tuple, Union, Pattern, Match, Dict, Any
-
-# Define token specifications
-token_specification = [
-    ('BLOCK_COMMENT', r'"""(.|\n)*?"""'),
-    ('COMMENT',       r'#.*'),
-    ('NUMBER',        r'\d+(\.\d+)?'),
-    ('STRING',        r'"([^"\\]|\\.)*"'),
-    ('BOOL',          r'\b(True|False)\b'),
-    ('NULL',          r'\bnull\b'),
-    ('IDENT',         r'[A-Za-z_][A-Za-z0-9_]*'),
-    ('AT',            r'@'),
-    ('ASSIGN',        r'='),
-    ('OP',            r'==|!=|>=|<=|//|[\+\-\*/%<>]'),
-    ('ARROW',         r'->'),
-    ('COLON',         r':'),
-    ('COMMA',         r','),
-    ('SEMICOLON',     r';'),
-    ('LPAREN',        r'\('),
-    ('RPAREN',        r'\)'),
-    ('LBRACE',        r'\{'),
-    ('RBRACE',        r'\}'),
-    ('LBRACKET',      r'\['),
-    ('RBRACKET',      r'\]'),
-    ('NEWLINE',       r'\n'),
-    ('SKIP',          r'[ \t]+'),
-    ('MISMATCH',      r'.'),
-]
-
-# Compile regex
-tok_regex = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_specification)
-get_token: Pattern = re.compile(tok_regex).match
+from array import array
+import sys
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Iterator, NamedTuple, Sequence, Tuple
+
+# Token kinds. Small ints compare by identity, which makes the parser's
+# kind checks cheaper than comparing strings.
+(KEYWORD, IDENT, NUMBER, STRING, BOOL, NULL, OP, ASSIGN, ARROW, COLON, COMMA,
+ SEMICOLON, LPAREN, RPAREN, LBRACE, RBRACE, LBRACKET, RBRACKET, AT) = range(1, 20)
+
+# Token kind -> name, for error messages and the dictionary form of tokens
+KIND_NAMES = {
+    KEYWORD: 'KEYWORD', IDENT: 'IDENT', NUMBER: 'NUMBER', STRING: 'STRING',
+    BOOL: 'BOOL', NULL: 'NULL', OP: 'OP', ASSIGN: 'ASSIGN', ARROW: 'ARROW',
+    COLON: 'COLON', COMMA: 'COMMA', SEMICOLON: 'SEMICOLON', LPAREN: 'LPAREN',
+    RPAREN: 'RPAREN', LBRACE: 'LBRACE', RBRACE: 'RBRACE', LBRACKET: 'LBRACKET',
+    RBRACKET: 'RBRACKET', AT: 'AT',
+}
+
+# Single-character punctuation and the token kind it produces
+single_punct = {
+    '+': OP, '-': OP, '*': OP, '/': OP, '%': OP, '<': OP, '>': OP,
+    '=': ASSIGN, '@': AT, ':': COLON, ',': COMMA, ';': SEMICOLON,
+    '(': LPAREN, ')': RPAREN, '{': LBRACE, '}': RBRACE,
+    '[': LBRACKET, ']': RBRACKET,
+}
+
+# Two-character operators; these are tried first so the longest operator wins
+double_punct = {
+    '==': OP, '!=': OP, '>=': OP, '<=': OP, '//': OP, '->': ARROW,
+}
+
+
+# Keywords that denote a literal value rather than a KEYWORD token
+literal_keywords = {'True': BOOL, 'False': BOOL, 'null': NULL}
 
 # Keywords
-keywords = {
+keywords = frozenset({
     'var', 'const', 'def', 'macro', 'comptime', 'type', 'extends',
     'if', 'else', 'for', 'in', 'match', 'try', 'except', 'raise',
     'return', 'test', 'assertEqual', 'assertNotEqual', 'assertTrue',
     'assertFalse', 'assertRaises', 'print', 'null', 'True', 'False',
     'number', 'float', 'int', 'string', 'bool', 'list', 'dict'
-}
+})
+
+
+# Operator text -> token kind
+punct_kinds = {**single_punct, **double_punct}
+
+# Word or operator text -> (kind, value) of its token. The value is the
+# table's own key, so every token for the same keyword or operator shares
+# one string object instead of a fresh slice of the source per occurrence.
+keyword_tokens = {word: (literal_keywords.get(word, KEYWORD), word) for word in keywords}
+punct_tokens = {text: (kind, text) for text, kind in punct_kinds.items()}
+
+# The whole token grammar as one regular expression. A match skips any
+# blanks and then takes exactly one alternative, so finditer() walks the
+# source token by token inside the C regex engine. Operators are listed
+# longest first for maximal munch ('==' and '->' are single tokens), and a
+# block comment is tried before a string so '"""' is not read as '""'.
+# The last two alternatives always match, at the end of the input or on any
+# single character, so finditer() can never search past an unexpected
+# character: it becomes an ERROR match at its own position.
+token_regex = re.compile(r'''[ \t\n]*(?:
+    (?P<IDENT>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<PUNCT>%s)
+  | (?P<NUMBER>\d+(?:\.\d+)?)          # a fractional part needs a digit after the dot
+  | (?P<COMMENT>\#[^\n]*|"""[\s\S]*?""")
+  | (?P<STRING>"(?:[^"\\]|\\[^\n])*")
+  | (?P<END>\Z)
+  | (?P<ERROR>[\s\S])
+)''' % '|'.join(re.escape(p) for p in sorted(punct_kinds, key=len, reverse=True)), re.VERBOSE)
+
+# Group number of each alternative, for dispatching on Match.lastindex
+(IDENT_GROUP, PUNCT_GROUP, NUMBER_GROUP, COMMENT_GROUP, STRING_GROUP, END_GROUP,
+ ERROR_GROUP) = (token_regex.groupindex[name] for name in
+                 ('IDENT', 'PUNCT', 'NUMBER', 'COMMENT', 'STRING', 'END', 'ERROR'))
+
+
+class Token(NamedTuple):
+    """
+    A single token, as produced by indexing or iterating a Tokens stream.
 
-def tokenize(code: str) -> List[Dict[str, Any]]:
+    A named tuple: fields are read by name or by index at a fixed offset,
+    there is no per-instance __dict__, and token[:2] is the (type, value)
+    pair. The text of the token's line is not copied into it; look it up
+    with Tokens.line_text(token.line).
     """
-    Tokenize the input code into a list of tokens.
-    
-    Each token includes information for error reporting such as line number,
-    column position, and the full text of the line containing the token.
-    
+    # The token kind's name, e.g. 'IDENT'
+    type: str
+    # The source text of the token
+    value: str
+    # The 1-based line and column the token starts at
+    line: int
+    col: int
+
+    def __repr__(self) -> str:
+        return f"Token({self.type}, {self.value!r}, {self.line}, {self.col})"
+
+
+class Tokens:
+    """
+    The token stream of a source file, stored as parallel columns.
+
+    Token i is described by kinds[i] (one of the kind constants above),
+    values[i] and offsets[i], the index of its first character in the
+    source. Kinds and values are lists; offsets are only read to locate
+    errors, so they are packed into an array of 64-bit ints. One column per
+    field instead of one object per token keeps the stream small and lets
+    the parser read only the column it needs.
+
+    Line and column numbers are not stored per token. They are derived on
+    demand from the start offset of every line, which is built once per
+    file, so only error reporting pays for them. The source itself is kept
+    and a line's text is sliced out of it when an error message shows it.
+
+    Indexing or iterating builds a Token object for callers that want one
+    value per token.
+    """
+    __slots__ = ('kinds', 'values', 'offsets', 'line_starts', 'source')
+
+    def __init__(self, source: str):
+        """
+        Initialize an empty token stream.
+
+        Parameters:
+            source (str): The tokenized source code.
+        """
+        self.kinds: List[int] = []
+        self.values: List[str] = []
+        # Filled in by tokenize() once the whole source has been scanned
+        self.offsets: Sequence[int] = array('q')
+        self.line_starts: List[int] = line_starts(source)
+        self.source = source
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> Token:
+        """
+        Build the Token object for a single token.
+
+        Parameters:
+            index (int): The position of the token in the stream.
+        Returns:
+            Token: The token's type, value, line and col.
+        """
+        line, col = self.location(index)
+        return Token(KIND_NAMES[self.kinds[index]], self.values[index], line, col)
+
+    def __iter__(self) -> Iterator[Token]:
+        return (self[i] for i in range(len(self.kinds)))
+
+    def location(self, index: int) -> Tuple[int, int]:
+        """
+        Get the line and column of a token.
+
+        Parameters:
+            index (int): The position of the token in the stream.
+        Returns:
+            Tuple[int, int]: The 1-based line and column of the token's first character.
+        """
+        return offset_location(self.line_starts, self.offsets[index])
+
+    def line_text(self, line: int) -> str:
+        """
+        Get the text of a source line.
+
+        Parameters:
+            line (int): The 1-based line number.
+        Returns:
+            str: The line without its newline, or "" if there is no such line.
+        """
+        starts = self.line_starts
+        if 0 < line < len(starts):
+            return self.source[starts[line - 1]:starts[line] - 1]
+        if line == len(starts):
+            return self.source[starts[line - 1]:]
+        return ""
+
+
+def line_starts(source: str) -> List[int]:
+    """
+    Compute the offset at which every source line starts.
+
+    The lines from split() are only used for their lengths and are dropped
+    straight away; this is faster than searching for each newline in turn.
+
+    Parameters:
+        source (str): The source code.
+    Returns:
+        List[int]: The offset of the first character of each line, in order.
+    """
+    return [0, *accumulate(len(text) + 1 for text in source.split('\n')[:-1])]
+
+
+def offset_location(starts: List[int], offset: int) -> Tuple[int, int]:
+    """
+    Convert a source offset to a line and column with a binary search.
+
+    Parameters:
+        starts (List[int]): The line start offsets from line_starts().
+        offset (int): The index of a character in the source.
+    Returns:
+        Tuple[int, int]: The 1-based line and column of the offset.
+    """
+    line = bisect_right(starts, offset)
+    return line, offset - starts[line - 1] + 1
+
+
+class TokenizerError(RuntimeError):
+    """
+    An unexpected character in the source.
+
+    Only the source and the offset of the character are stored when the
+    error is raised. The report with line, column, the source line and a
+    caret is assembled by __str__, so an error that is caught and discarded
+    never pays for formatting.
+    """
+    __slots__ = ('char', 'tokens', 'offset')
+
+    def __init__(self, tokens: Tokens, offset: int):
+        """
+        Initialize a tokenizer error.
+
+        Parameters:
+            tokens (Tokens): The stream being built, which holds the source and its line index.
+            offset (int): The index of the unexpected character in the source.
+        """
+        self.char = tokens.source[offset]
+        super().__init__(f"Unexpected character '{self.char}'")
+        self.tokens = tokens
+        self.offset = offset
+
+    def __reduce__(self):
+        # Rebuild from the constructor's arguments, not from args, so the
+        # error survives pickling, e.g. out of a ProcessPoolExecutor worker
+        return type(self), (self.tokens, self.offset)
+
+    def __str__(self) -> str:
+        line, col = offset_location(self.tokens.line_starts, self.offset)
+        line_text = self.tokens.line_text(line)
+        error_msg = f"Unexpected character '{self.char}' at line {line}, column {col}"
+        error_msg += f"\n{line}: {line_text}"
+        error_msg += "\n" + " " * (col + len(str(line)) + 1) + "^"
+        return error_msg
+
+
+def tokenize(code: str) -> Tokens:
+    """
+    Tokenize the input code into a stream of tokens.
+
+    Each token records the offset it starts at; the stream converts that to
+    a line and column for error reporting and keeps the source lines for
+    context.
+
+    The source is scanned in a single pass of token_regex.finditer(); the
+    alternative that matched selects the token kind. A string may contain
+    backslash escapes but an escape may not swallow a newline.
+
     Parameters:
         code (str): The source code to tokenize.
-        
+
     Returns:
-        List[Dict[str, Any]]: A list of token dictionaries with type, value, and location info.
-        
+        Tokens: The token kinds, values and locations as parallel columns.
+
     Raises:
-        RuntimeError: If an unexpected character is encountered.
+        TokenizerError: If an unexpected character is encountered.
     """
-    pos = 0
-    tokens = []
-    line = 1
-    line_start = 0
-    
-    # Split the code into lines for context reporting
-    code_lines = code.split('\n')
-    
-    mo: Union[Match, None] = get_token(code, pos)
-    
-    while mo:
-        kind = mo.lastgroup
-        value = mo.group()
-        col = mo.start() - line_start + 1
-        
-        # Get the text of the current line
-        line_idx = line - 1  # Convert to 0-based indexing
-        line_text = code_lines[line_idx] if line_idx < len(code_lines) else ""
-        
-        if kind == 'NEWLINE':
-            line += 1
-            line_start = mo.end()
-        elif kind in ('COMMENT', 'BLOCK_COMMENT', 'SKIP'):
-            # Skip these tokens but count newlines in block comments
-            if kind == 'BLOCK_COMMENT':
-                newlines = value.count('\n')
-                if newlines > 0:
-                    line += newlines
-                    last_newline = value.rfind('\n')
-                    if last_newline >= 0:
-                        line_start = pos + last_newline + 1
-        elif kind == 'NUMBER':
-            tokens.append({
-                'type': 'NUMBER',
-                'value': value,
-                'line': line,
-                'col': col,
-                'line_text': line_text
-            })
-        elif kind == 'STRING':
-            tokens.append({
-                'type': 'STRING',
-                'value': value,
-                'line': line,
-                'col': col,
-                'line_text': line_text
-            })
-        elif kind == 'BOOL':
-            tokens.append({
-                'type': 'BOOL',
-                'value': value,
-                'line': line,
-                'col': col,
-                'line_text': line_text
-            })
-        elif kind == 'NULL':
-            tokens.append({
-                'type': 'NULL',
-                'value': value,
-                'line': line,
-                'col': col,
-                'line_text': line_text
-            })
-        elif kind == 'IDENT':
-            token_type = 'KEYWORD' if value in keywords else 'IDENT'
-            tokens.append({
-                'type': token_type,
-                'value': value,
-                'line': line,
-                'col': col,
-                'line_text': line_text
-            })
-        elif kind in ('AT', 'OP', 'ASSIGN', 'ARROW', 'COLON', 'COMMA',
-                    'SEMICOLON', 'LPAREN', 'RPAREN', 'LBRACE', 'RBRACE',
-                    'LBRACKET', 'RBRACKET'):
-            tokens.append({
-                'type': kind,
-                'value': value,
-                'line': line,
-                'col': col,
-                'line_text': line_text
-            })
-        elif kind == 'MISMATCH':
-            error_msg = f"Unexpected character '{value}' at line {line}, column {col}"
-            error_msg += f"\n{line}: {line_text}"
-            error_msg += "\n" + " " * (col + len(str(line)) + 1) + "^"
-            raise RuntimeError(error_msg)
-            
-        pos = mo.end()
-        mo = get_token(code, pos)
-        
+    tokens = Tokens(code)
+    append_kind = tokens.kinds.append
+    append_value = tokens.values.append
+    offsets: List[int] = []
+    append_offset = offsets.append
+
+    for mo in token_regex.finditer(code):
+        group = mo.lastindex
+        if group == IDENT_GROUP:
+            # mo[group] is a subscript, which skips the attribute lookup and
+            # method call of mo.group(group)
+            value = mo[group]
+            # One hash probe settles both keywords and identifiers
+            token = keyword_tokens.get(value)
+            if token is not None:
+                kind, value = token
+            else:
+                # Interned names hash once and compare by identity in the
+                # interpreter's variable dictionaries
+                kind = IDENT
+                value = sys.intern(value)
+        elif group == PUNCT_GROUP:
+            kind, value = punct_tokens[mo[group]]
+        elif group == NUMBER_GROUP:
+            kind = NUMBER
+            value = mo[group]
+        elif group == STRING_GROUP:
+            kind = STRING
+            value = mo[group]
+        elif group == COMMENT_GROUP:
+            continue
+        elif group == END_GROUP:
+            break
+        else:
+            # Includes an unterminated string, reported at its opening quote
+            raise TokenizerError(tokens, mo.start(ERROR_GROUP))
+
+        append_kind(kind)
+        append_value(value)
+        append_offset(mo.start(group))
+
+    # Offsets are only read to locate errors, so they are kept as packed
+    # machine ints rather than a list of int objects. Appending to a list and
+    # converting once at the end is faster than appending to the array.
+    tokens.offsets = array('q', offsets)
     return tokens
@@ -1,22 +1,90 @@
+import hashlib
 import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
-from src.tokenizer import tokenize
+from src import tokenizer
+from src.tokenizer import Tokens, tokenize
 
 
-def process_file(path):
+def tokenizer_fingerprint():
+    # Cache entries are pickled Tokens, so they are only valid for the
+    # tokenizer that wrote them. Keying on the module's own bytes and on the
+    # pickled slot layout means any change to either misses the old entries
+    # without anyone having to remember to bump a version number
+    digest = hashlib.sha256(repr(Tokens.__slots__).encode('utf-8'))
+    with open(tokenizer.__file__, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+CACHE_VERSION = tokenizer_fingerprint()
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'handylang')
+
+
+def cached_tokenize(code):
+    # Tokenizing is deterministic, so the result is cached on disk under a
+    # hash of the source and re-runs over an unchanged tree skip the work
+    key = hashlib.sha256(f"{CACHE_VERSION}\0{code}".encode('utf-8')).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"tok-{key}.pkl")
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # A truncated file, or one pickled from a different Tokens layout,
+        # can fail in many ways (e.g. AttributeError on a removed slot).
+        # Whatever went wrong, it is a miss; drop the entry so it is rewritten
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+
+    tokens = tokenize(code)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write then rename, so a concurrent reader never sees a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(tokens, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is only an optimisation; an unwritable directory is fine
+        pass
+    return tokens
+
+
+def count_tokens(path):
     with open(path, 'r') as f:
         code = f.read()
-    tokens = tokenize(code)
-    print(f"{path}: {len(tokens)} tokens")
+    return path, len(cached_tokenize(code))
+
+
+def process_file(path):
+    path, count = count_tokens(path)
+    print(f"{path}: {count} tokens")
 
 
 def process_directory(dir_path):
+    # Collect the whole tree first so every file can be handed to the pool
+    walk = []
     for root, _, files in os.walk(dir_path):
-        print(f"Processing directory: {root}")
-        for file in files:
-            if file.endswith('.hdy'):
-                process_file(os.path.join(root, file))
+        walk.append((root, [os.path.join(root, file) for file in files if file.endswith('.hdy')]))
+    paths = [path for _, dir_paths in walk for path in dir_paths]
+
+    # Tokenizing is CPU-bound and each file is independent, so the files are
+    # spread over worker processes. map() yields results in submission order,
+    # which keeps the output, and the first error raised, the same as a
+    # sequential walk.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        counts = executor.map(count_tokens, paths, chunksize=8)
+        for root, dir_paths in walk:
+            print(f"Processing directory: {root}")
+            for _ in dir_paths:
+                path, count = next(counts)
+                print(f"{path}: {count} tokens")
 
 
 if __name__ == '__main__':
@@ -7,6 +7,7 @@ functionality in HandyLang tokenizer and parser.
 
 import os
 import difflib
+import functools
 from typing import List, Dict, Any, Tuple, Optional, Union
 import unittest
 
@@ -14,8 +15,60 @@ from src.tokenizer import tokenize
 from src.parser import Parser
 
 
+@functools.lru_cache(maxsize=256)
+def cached_tokenize(code: str):
+    """
+    Tokenize the given code, reusing the result for source seen before.
+
+    Many tests parse the same snippet; the parser only reads the token
+    stream, so one Tokens object can safely be shared between them. A
+    tokenizer error is not cached and is raised again on every call.
+
+    Parameters:
+        code (str): The code to tokenize.
+    Returns:
+        Tokens: The token stream.
+    """
+    return tokenize(code)
+
+
 class ErrorReportingTestCase(unittest.TestCase):
     """Base class for testing error reporting functionality."""
+
+    def tokenize_error_message(self, code: str) -> str:
+        """
+        Tokenize the given code, assert that it fails and return the error message.
+
+        Parameters:
+            code (str): The code to tokenize.
+        Returns:
+            str: The error message.
+        """
+        # A bare try/except: assertRaises builds a context manager and keeps
+        # the traceback on every call, and these helpers run for most tests
+        try:
+            tokenize(code)
+        except Exception as e:
+            return str(e)
+        self.fail(f"Expected tokenizing to fail.\nCode: {code!r}")
+
+    def parse_error_message(self, code: str, filename: str = "test.hdy") -> str:
+        """
+        Parse the given code, assert that it fails and return the error message.
+
+        Parameters:
+            code (str): The code to parse.
+            filename (str): The filename to use for the parser.
+        Returns:
+            str: The error message.
+        """
+        parser = Parser(cached_tokenize(code), filename=filename)
+
+        try:
+            parser.parse()
+        except Exception as e:
+            return str(e)
+        self.fail(f"Expected parsing to fail.\nCode: {code!r}")
     
     def assert_tokenize_error(self, code: str, 
                              expected_msgs: List[str], 
@@ -28,10 +81,7 @@ class ErrorReportingTestCase(unittest.TestCase):
             expected_msgs (List[str]): Substrings expected in the error message.
             expected_line (Optional[int]): The expected line number in the error message.
         """
-        with self.assertRaises(Exception) as cm:
-            tokenize(code)
-        
-        error_msg = str(cm.exception)
+        error_msg = self.tokenize_error_message(code)
         for msg in expected_msgs:
             self.assertIn(msg, error_msg, 
                          f"Error message should contain '{msg}'.\nGot: {error_msg}")
@@ -53,13 +103,7 @@ class ErrorReportingTestCase(unittest.TestCase):
             filename (str): The filename to use for the parser.
             expected_line (Optional[int]): The expected line number in the error message.
         """
-        tokens = tokenize(code)
-        parser = Parser(tokens, filename=filename)
-        
-        with self.assertRaises(Exception) as cm:
-            parser.parse()
-        
-        error_msg = str(cm.exception)
+        error_msg = self.parse_error_message(code, filename)
         for msg in expected_msgs:
             self.assertIn(msg, error_msg, 
                          f"Error message should contain '{msg}'.\nGot: {error_msg}")
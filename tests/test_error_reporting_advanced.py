@@ -17,21 +17,12 @@ from typing import List, Optional, Dict, Any
 
 from src.tokenizer import tokenize
 from src.parser import Parser
+from tests.error_test_utils import ErrorReportingTestCase
 
 
-class TestNestedContextErrors(unittest.TestCase):
+class TestNestedContextErrors(ErrorReportingTestCase):
     """Test error reporting in nested contexts like functions, blocks, etc."""
     
-    def _parse_with_error(self, code: str, filename: str = "test.hdy") -> str:
-        """Helper to parse code and return error message."""
-        tokens = tokenize(code)
-        parser = Parser(tokens, filename=filename)
-        
-        with self.assertRaises(Exception) as cm:
-            parser.parse()
-            
-        return str(cm.exception)
-    
     def test_deeply_nested_function(self):
         """Test error reporting in deeply nested functions."""
         code = """def outer() {
@@ -43,7 +34,7 @@ class TestNestedContextErrors(unittest.TestCase):
         }
     }
 }"""
-        error_msg = self._parse_with_error(code)
+        error_msg = self.parse_error_message(code)
         
         self.assertIn("5:", error_msg, "Error should point to line 5")
         self.assertIn("print(x, y,", error_msg, "Error should include the line content")
@@ -57,7 +48,7 @@ class TestNestedContextErrors(unittest.TestCase):
         }
     }
 }"""
-        error_msg = self._parse_with_error(code)
+        error_msg = self.parse_error_message(code)
         
         self.assertIn("4:", error_msg, "Error should point to line 4")
         self.assertIn("var z = *", error_msg, "Error should include the line content")
@@ -78,10 +69,11 @@ class TestEOFErrors(unittest.TestCase):
             self.fail("Should have raised an error for unterminated string")
         except Exception as e:
             error_msg = str(e)
+            error_msg_lower = error_msg.lower()
             self.assertTrue(
-                "unterminated" in error_msg.lower() or 
-                "unexpected" in error_msg.lower() or
-                "string" in error_msg.lower(),
+                "unterminated" in error_msg_lower or 
+                "unexpected" in error_msg_lower or
+                "string" in error_msg_lower,
                 f"Error message should mention unterminated string: {error_msg}"
             )
     
@@ -98,34 +90,25 @@ class TestEOFErrors(unittest.TestCase):
             parser.parse()
             
         error_msg = str(cm.exception)
+        error_msg_lower = error_msg.lower()
         self.assertTrue(
             "}" in error_msg or 
-            "brace" in error_msg.lower() or
-            "block" in error_msg.lower() or
-            "expected" in error_msg.lower(),
+            "brace" in error_msg_lower or
+            "block" in error_msg_lower or
+            "expected" in error_msg_lower,
             f"Error message should mention missing brace or block: {error_msg}"
         )
 
 
-class TestComplexStructures(unittest.TestCase):
+class TestComplexStructures(ErrorReportingTestCase):
     """Test error reporting in complex language structures."""
     
-    def _parse_with_error(self, code: str, filename: str = "test.hdy") -> str:
-        """Helper to parse code and return error message."""
-        tokens = tokenize(code)
-        parser = Parser(tokens, filename=filename)
-        
-        with self.assertRaises(Exception) as cm:
-            parser.parse()
-            
-        return str(cm.exception)
-    
     def test_function_with_complex_params(self):
         """Test error reporting in functions with complex parameter lists."""
         code = """def func(a: number, b: string, c: = 10) {
     print(a, b, c)
 }"""
-        error_msg = self._parse_with_error(code)
+        error_msg = self.parse_error_message(code)
         
         self.assertIn("1:", error_msg, "Error should point to line 1")
         self.assertIn("c: =", error_msg, "Error should include the problematic code")
@@ -136,7 +119,7 @@ class TestComplexStructures(unittest.TestCase):
     var result = (10 + 20) * (30 / (40 - )) 
     return result
 }"""
-        error_msg = self._parse_with_error(code)
+        error_msg = self.parse_error_message(code)
         
         self.assertIn("2:", error_msg, "Error should point to line 2")
         self.assertIn(")", error_msg, "Error should mention the problematic token")
@@ -156,10 +139,11 @@ class TestSpecialCases(unittest.TestCase):
             parser.parse()
             
         error_msg = str(cm.exception)
+        error_msg_lower = error_msg.lower()
         self.assertTrue(
             "]" in error_msg or 
-            "bracket" in error_msg.lower() or
-            "expected" in error_msg.lower(),
+            "bracket" in error_msg_lower or
+            "expected" in error_msg_lower,
             f"Error message should mention missing bracket: {error_msg}"
         )
     
@@ -10,40 +10,26 @@ This test suite covers:
 5. Showing relevant code context in errors
 """
 
-import os
+import re
 import unittest
-import tempfile
 
 from src.tokenizer import tokenize
 from src.parser import Parser
+from tests.error_test_utils import ErrorReportingTestCase
 
 
-class TestErrorMessageContent(unittest.TestCase):
+# A column number from 11 to 15 followed by a colon, e.g. ":13:" or ", 13:"
+_COL_PATTERN = re.compile(r'[:, ](1[1-5]):')
+
+
+class TestErrorMessageContent(ErrorReportingTestCase):
     """Test the content and formatting of error messages."""
     
-    def _parse_code(self, code: str, filename: str = "test.hdy") -> str:
-        """
-        Parse the given code and return the error message if an error occurs.
-        
-        Parameters:
-            code (str): The code to parse
-            filename (str): The filename to use
-        Returns:
-            str: The error message
-        """
-        tokens = tokenize(code)
-        parser = Parser(tokens, filename=filename)
-        
-        with self.assertRaises(Exception) as cm:
-            parser.parse()
-            
-        return str(cm.exception)
-        
     def test_error_message_includes_custom_filename(self):
         """Error messages should include the specified filename."""
         filename = "special_test.hdy"
         code = "var x = +"
-        error_msg = self._parse_code(code, filename)
+        error_msg = self.parse_error_message(code, filename)
         
         self.assertIn(filename, error_msg, 
                      f"Error message should include filename '{filename}'")
@@ -56,7 +42,7 @@ var b = 20
 def test() {
     var c = *
 }"""
-        error_msg = self._parse_code(code)
+        error_msg = self.parse_error_message(code)
         
         # The error could be reported on line 4 or 5, depending on the parser implementation
         self.assertTrue(
@@ -67,22 +53,16 @@ def test() {
     def test_error_message_includes_approximate_column_number(self):
         """Error messages should include an approximate column number."""
         code = "var x = 10 + * 5"
-        error_msg = self._parse_code(code)
+        error_msg = self.parse_error_message(code)
         
         # Test for column number in a more flexible way
-        has_column_indicator = False
-        for i in range(11, 16):  # Check columns 11-15
-            if f":{i}:" in error_msg or f", {i}:" in error_msg or f" {i}:" in error_msg:
-                has_column_indicator = True
-                break
-        
-        self.assertTrue(has_column_indicator, 
+        self.assertTrue(_COL_PATTERN.search(error_msg),
                        "Error message should include a column number near the error")
     
     def test_error_message_includes_source_code_line(self):
         """Error messages should include the source code line with the error."""
         code_line = "var x = 10 + * 5"
-        error_msg = self._parse_code(code_line)
+        error_msg = self.parse_error_message(code_line)
         
         self.assertIn(code_line, error_msg, 
                      "Error message should include the code line with the error")
@@ -90,39 +70,26 @@ def test() {
     def test_error_message_includes_caret_pointer(self):
         """Error messages should include a caret (^) pointing to the error location."""
         code = "var x = 10 + * 5"
-        error_msg = self._parse_code(code)
+        error_msg = self.parse_error_message(code)
         
         self.assertIn("^", error_msg, 
                      "Error message should include a caret (^) pointing to the error")
 
 
-class TestTokenizerErrors(unittest.TestCase):
+class TestTokenizerErrors(ErrorReportingTestCase):
     """Test error reporting from the tokenizer."""
     
-    def _tokenize_with_error(self, code: str) -> str:
-        """
-        Tokenize the given code and return the error message if an error occurs.
-        
-        Parameters:
-            code (str): The code to tokenize
-        Returns:
-            str: The error message
-        """
-        with self.assertRaises(Exception) as cm:
-            tokenize(code)
-            
-        return str(cm.exception)
-    
     def test_invalid_dollar_sign_reports_unexpected_character(self):
         """Dollar sign character should be reported as invalid with appropriate message."""
         code = "var x = 10 + $ 5"
-        error_msg = self._tokenize_with_error(code)
+        error_msg = self.tokenize_error_message(code)
         
         # Check for expected error message patterns
+        error_msg_lower = error_msg.lower()
         self.assertTrue(
-            "unexpected character" in error_msg.lower() or
-            "invalid character" in error_msg.lower() or
-            "illegal character" in error_msg.lower(),
+            "unexpected character" in error_msg_lower or
+            "invalid character" in error_msg_lower or
+            "illegal character" in error_msg_lower,
             "Error message should mention the unexpected/invalid character"
         )
         self.assertIn("$", error_msg)
@@ -130,70 +97,55 @@ class TestTokenizerErrors(unittest.TestCase):
     def test_invalid_character_error_includes_caret(self):
         """Invalid character errors should include a caret pointer."""
         code = "var x = 10 + $ 5"
-        error_msg = self._tokenize_with_error(code)
+        error_msg = self.tokenize_error_message(code)
         self.assertIn("^", error_msg)
-    
-    def test_multiline_code_error_reports_correct_line(self):
-        """For multiline code, the error should report the correct line number."""
-        code = """var a = 10
+
+
+class TestTokenizerMultilineError(unittest.TestCase):
+    """Test the tokenizer error for one multiline source, tokenized once for all checks."""
+
+    CODE = """var a = 10
 var b = 20
 var c = $
 var d = 30"""
-        error_msg = self._tokenize_with_error(code)
-        
-        self.assertIn("line 3", error_msg.lower())
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Tokenize the shared source once and keep its error message."""
+        try:
+            tokenize(cls.CODE)
+        except Exception as e:
+            cls.error_msg = str(e)
+        else:
+            raise AssertionError("Tokenizing the code should raise an error")
+
+    def test_multiline_code_error_reports_correct_line(self):
+        """For multiline code, the error should report the correct line number."""
+        self.assertIn("line 3", self.error_msg.lower())
+
     def test_multiline_code_error_shows_offending_line(self):
         """For multiline code, the error should show the specific line with the error."""
-        code = """var a = 10
-var b = 20
-var c = $
-var d = 30"""
-        error_msg = self._tokenize_with_error(code)
-        
-        self.assertIn("var c = $", error_msg)
-    
+        self.assertIn("var c = $", self.error_msg)
+
     def test_multiline_code_error_includes_caret(self):
         """For multiline code, the error should include a caret pointer."""
-        code = """var a = 10
-var b = 20
-var c = $
-var d = 30"""
-        error_msg = self._tokenize_with_error(code)
-        self.assertIn("^", error_msg)
+        self.assertIn("^", self.error_msg)
 
 
-class TestParserErrors(unittest.TestCase):
+class TestParserErrors(ErrorReportingTestCase):
     """Test error reporting from the parser."""
     
-    def _parse_with_error(self, code: str, filename: str = "test.hdy") -> str:
-        """
-        Parse the given code and return the error message if an error occurs.
-        
-        Parameters:
-            code (str): The code to parse
-            filename (str): The filename to use
-        Returns:
-            str: The error message
-        """
-        tokens = tokenize(code)
-        parser = Parser(tokens, filename=filename)
-        
-        with self.assertRaises(Exception) as cm:
-            parser.parse()
-            
-        return str(cm.exception)
-    
     def test_incomplete_expression_produces_relevant_error(self):
         """Incomplete expressions should produce a relevant error message."""
         code = "var x = 10 +"
-        error_msg = self._parse_with_error(code)
+        error_msg = self.parse_error_message(code)
         
         # Check that the error mentions something being unexpected or expected
+        error_msg_lower = error_msg.lower()
         self.assertTrue(
-            "unexpected" in error_msg.lower() or 
-            "expected" in error_msg.lower() or
-            "missing" in error_msg.lower(),
+            "unexpected" in error_msg_lower or 
+            "expected" in error_msg_lower or
+            "missing" in error_msg_lower,
             "Error message should indicate a problem with the expression"
         )
     
@@ -202,7 +154,7 @@ class TestParserErrors(unittest.TestCase):
         code = """var x = 10
 var y = 20 ;
 var z = 30 +"""
-        error_msg = self._parse_with_error(code)
+        error_msg = self.parse_error_message(code)
         
         # Check that the error refers to line 3
         self.assertIn("3", error_msg, 
@@ -216,14 +168,15 @@ var z = 30 +"""
         print("Greater than 5")
     
 }"""
-        error_msg = self._parse_with_error(code)
+        error_msg = self.parse_error_message(code)
         
         # The error should be related to block structure or braces
+        error_msg_lower = error_msg.lower()
         self.assertTrue(
             "}" in error_msg or 
-            "brace" in error_msg.lower() or
-            "block" in error_msg.lower() or
-            "expected" in error_msg.lower(),
+            "brace" in error_msg_lower or
+            "block" in error_msg_lower or
+            "expected" in error_msg_lower,
             "Error message should indicate a problem with braces or block structure"
         )
 
@@ -266,10 +219,11 @@ class TestEdgeCases(unittest.TestCase):
         error_msg = str(cm.exception)
         
         # Test that the error message is informative
+        error_msg_lower = error_msg.lower()
         self.assertTrue(
-            "unexpected character" in error_msg.lower() or
-            "invalid character" in error_msg.lower() or
-            "illegal character" in error_msg.lower(),
+            "unexpected character" in error_msg_lower or
+            "invalid character" in error_msg_lower or
+            "illegal character" in error_msg_lower,
             "Error message should mention the unexpected/invalid character"
         )
         
@@ -280,65 +234,42 @@ class TestEdgeCases(unittest.TestCase):
 
 class TestFileIntegration(unittest.TestCase):
     """Test error reporting with file integration."""
-    
-    def test_error_in_temp_file_includes_filename(self):
-        """Errors in a temporary file should include the filename in the error message."""
-        with tempfile.NamedTemporaryFile(suffix=".hdy", mode="w+", delete=False) as tmp:
-            tmp_path = tmp.name
-            tmp.write('''def test() {
-    var x = 10
-    print(x
-}''')
-            
-        try:
-            with open(tmp_path, 'r') as f:
-                code = f.read()
-                
-            tokens = tokenize(code)
-            parser = Parser(tokens, filename=tmp_path)
-            
-            with self.assertRaises(Exception) as cm:
-                parser.parse()
-                
-            error_msg = str(cm.exception)
-            
-            # Check that the error message includes the filename
-            self.assertIn(os.path.basename(tmp_path), error_msg, 
-                         "Error message should include the filename")
-        finally:
-            os.unlink(tmp_path)
-    
-    def test_error_in_temp_file_shows_code_context(self):
-        """Errors in a temporary file should show the code context in the error message."""
-        with tempfile.NamedTemporaryFile(suffix=".hdy", mode="w+", delete=False) as tmp:
-            tmp_path = tmp.name
-            tmp.write('''def test() {
+
+    @classmethod
+    def setUpClass(cls):
+        """Parse the source once, under a file name, for all checks."""
+        # Only the filename string is observed, so no file is written
+        cls.filename = "fake.hdy"
+        code = '''def test() {
     var x = 10
     print(x
-}''')
-            
+}'''
+
+        tokens = tokenize(code)
+        parser = Parser(tokens, filename=cls.filename)
         try:
-            with open(tmp_path, 'r') as f:
-                code = f.read()
-                
-            tokens = tokenize(code)
-            parser = Parser(tokens, filename=tmp_path)
-            
-            with self.assertRaises(Exception) as cm:
-                parser.parse()
-                
-            error_msg = str(cm.exception)
-            
-            # Check that the error message includes some code context from the file
-            # The specific context shown may vary depending on the parser implementation
-            self.assertTrue(
-                "def test" in error_msg or
-                "var x" in error_msg or
-                "print" in error_msg,
-                "Error message should include some code context from the file"
-            )
-        finally:
-            os.unlink(tmp_path)
+            parser.parse()
+        except Exception as e:
+            cls.error_msg = str(e)
+        else:
+            raise AssertionError("Parsing the source should raise an error")
+
+    def test_error_includes_filename(self):
+        """Errors should include the parser's filename in the error message."""
+        # Check that the error message includes the filename
+        self.assertIn(self.filename, self.error_msg,
+                     "Error message should include the filename")
+
+    def test_error_shows_code_context(self):
+        """Errors should show the code context in the error message."""
+        # Check that the error message includes some code context from the source
+        # The specific context shown may vary depending on the parser implementation
+        self.assertTrue(
+            "def test" in self.error_msg or
+            "var x" in self.error_msg or
+            "print" in self.error_msg,
+            "Error message should include some code context from the file"
+        )
 
 
 if __name__ == "__main__":
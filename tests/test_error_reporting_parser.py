@@ -8,49 +8,31 @@ checking various syntax errors at the statement, expression, and structural leve
 
 import unittest
 import os
-from typing import List, Dict, Any, Tuple, Optional
+import re
 
 from src.tokenizer import tokenize
 from src.parser import Parser
+from tests.error_test_utils import ErrorReportingTestCase
 
 
-class TestParserErrorReporting(unittest.TestCase):
+# A column number from 1 to 19 between colons, e.g. ":7:"
+_COL_PATTERN = re.compile(r':(1[0-9]|[1-9]):')
+
+
+class TestParserErrorReporting(ErrorReportingTestCase):
     """Test error reporting in the parser."""
     
-    def _assert_parse_error(self, code: str, expected_msgs: List[str], 
-                           filename: str = "test.hdy",
-                           expected_line: Optional[int] = None):
-        """Helper to assert parse error messages."""
-        tokens = tokenize(code)
-        parser = Parser(tokens, filename=filename)
-        
-        with self.assertRaises(Exception) as cm:
-            parser.parse()
-        
-        error_msg = str(cm.exception)
-        for msg in expected_msgs:
-            self.assertIn(msg, error_msg, 
-                         f"Error message should contain '{msg}'.\nGot: {error_msg}")
-        
-        self.assertIn(filename, error_msg,
-                    f"Error message should contain filename '{filename}'.\nGot: {error_msg}")
-        
-        if expected_line is not None:
-            line_indicator = f":{expected_line}:"
-            self.assertIn(line_indicator, error_msg,
-                        f"Error message should contain '{line_indicator}'.\nGot: {error_msg}")
-    
     def test_statement_level_errors(self):
         """Test error reporting for statement-level syntax errors."""
         # Missing identifier in variable declaration
-        self._assert_parse_error(
+        self.assert_parse_error(
             'var = 10',
             ["Expected", "IDENT"],
             expected_line=1
         )
         
         # Missing expression in variable assignment
-        self._assert_parse_error(
+        self.assert_parse_error(
             'var x =',
             ["Unexpected", "Expected"],
             expected_line=1
@@ -58,7 +40,7 @@ class TestParserErrorReporting(unittest.TestCase):
         
         # Missing semicolon (if required by the language)
         try:
-            self._assert_parse_error(
+            self.assert_parse_error(
                 'var x = 10\nvar y = 20;',
                 ["Expected", "semicolon"],
                 expected_line=1
@@ -70,21 +52,21 @@ class TestParserErrorReporting(unittest.TestCase):
     def test_expression_level_errors(self):
         """Test error reporting for expression-level syntax errors."""
         # Invalid binary operation (missing operand)
-        self._assert_parse_error(
+        self.assert_parse_error(
             'var x = 10 +',
             ["Unexpected", "Expected"],
             expected_line=1
         )
         
         # Invalid expression start
-        self._assert_parse_error(
+        self.assert_parse_error(
             'var x = * 5',
             ["Unexpected", "*"],
             expected_line=1
         )
         
         # Invalid expression with multiple operators
-        self._assert_parse_error(
+        self.assert_parse_error(
             'var x = 10 + * 5',
             ["Unexpected", "*"],
             expected_line=1
@@ -93,14 +75,14 @@ class TestParserErrorReporting(unittest.TestCase):
     def test_structural_errors(self):
         """Test error reporting for structural syntax errors."""
         # Missing closing parenthesis
-        self._assert_parse_error(
+        self.assert_parse_error(
             'var x = (10 + 5',
             ["Expected", "RPAREN"],
             expected_line=1
         )
         
         # Missing closing brace in function
-        self._assert_parse_error(
+        self.assert_parse_error(
             '''def test() {
                 var x = 10
             ''',
@@ -109,7 +91,7 @@ class TestParserErrorReporting(unittest.TestCase):
         )
         
         # Unmatched closing brace
-        self._assert_parse_error(
+        self.assert_parse_error(
             '''def test() {
                 var x = 10
             }}''',
@@ -228,7 +210,7 @@ class TestParserErrorMessages(unittest.TestCase):
         
         # Should have column information
         self.assertTrue(
-            any(f":{i}:" in error_msg for i in range(1, 20)),
+            _COL_PATTERN.search(error_msg),
             f"Error message should include column number. Got: {error_msg}"
         )
         
@@ -9,50 +9,39 @@ and malformed tokens.
 
 import unittest
 import os
+import re
 from typing import List, Dict, Any, Tuple, Optional
 
 from src.tokenizer import tokenize
 
 
+# The column number in a lowercased tokenizer error message
+_COL_RE = re.compile(r'column (\d+)')
+
+# The first line of the error for the '$' on line 3 of the multiline tests
+_LINE_3_DOLLAR_RE = re.compile(r'Unexpected character[^\n]*\$[^\n]*(?i:line) 3\b')
+
+
 class TestTokenizerBasicErrors(unittest.TestCase):
     """Test basic error reporting in the tokenizer."""
     
-    def test_dollar_sign_error(self):
-        """Test error reporting for dollar sign."""
-        with self.assertRaises(Exception) as cm:
-            tokenize("var x = $")
-        
-        error_msg = str(cm.exception)
-        self.assertIn("Unexpected character", error_msg)
-        self.assertIn("$", error_msg)
-        self.assertIn("line 1", error_msg.lower())
-    
-    def test_backtick_error(self):
-        """Test error reporting for backtick."""
-        with self.assertRaises(Exception) as cm:
-            tokenize("var x = `")
-        
-        error_msg = str(cm.exception)
-        self.assertIn("Unexpected character", error_msg)
-        self.assertIn("`", error_msg)
-        self.assertIn("line 1", error_msg.lower())
-    
-    def test_backslash_error(self):
-        """Test error reporting for backslash."""
-        with self.assertRaises(Exception) as cm:
-            tokenize("var x = \\")
-        
-        error_msg = str(cm.exception)
-        self.assertIn("Unexpected character", error_msg)
-        self.assertIn("\\", error_msg)
-        self.assertIn("line 1", error_msg.lower())
+    def test_invalid_character_errors(self):
+        """Test error reporting for dollar sign, backtick and backslash."""
+        for char in ("$", "`", "\\"):
+            with self.subTest(char=char):
+                with self.assertRaises(Exception) as cm:
+                    tokenize(f"var x = {char}")
+
+                self.assertRegex(
+                    str(cm.exception),
+                    rf'Unexpected character[^\n]*{re.escape(char)}[^\n]*(?i:line) 1\b')
     
     def test_at_symbol(self):
         """Test that @ symbol is a valid token."""
         # The @ symbol is actually valid in HandyLang, so this should NOT raise an error
         tokens = tokenize("var x = @")
         # Verify we got an AT token
-        at_tokens = [t for t in tokens if t['type'] == 'AT']
+        at_tokens = [t for t in tokens if t.type == 'AT']
         self.assertTrue(len(at_tokens) > 0, "Expected to find an AT token")
 
 
@@ -69,10 +58,7 @@ var d = 30"""
         with self.assertRaises(Exception) as cm:
             tokenize(code)
         
-        error_msg = str(cm.exception)
-        self.assertIn("Unexpected character", error_msg)
-        self.assertIn("$", error_msg)
-        self.assertIn("line 3", error_msg.lower())
+        self.assertRegex(str(cm.exception), _LINE_3_DOLLAR_RE)
     
     def test_error_after_comment(self):
         """Test error reporting after comments."""
@@ -83,9 +69,16 @@ var y = $  # error here"""
         with self.assertRaises(Exception) as cm:
             tokenize(code)
         
-        error_msg = str(cm.exception)
-        self.assertIn("line 3", error_msg.lower())
-        self.assertIn("$", error_msg)
+        self.assertRegex(str(cm.exception), _LINE_3_DOLLAR_RE)
+
+    def test_error_after_multiline_string(self):
+        """Test that a newline inside a string still advances the line number."""
+        code = 'var s = "a\nb"\nvar x = $'
+
+        with self.assertRaises(Exception) as cm:
+            tokenize(code)
+
+        self.assertRegex(str(cm.exception), _LINE_3_DOLLAR_RE)
 
 
 class TestTokenizerErrorFormat(unittest.TestCase):
@@ -106,8 +99,9 @@ class TestTokenizerErrorFormat(unittest.TestCase):
         
         error_msg = str(cm.exception)
         # $ is at index 10, so column should be around there
+        match = _COL_RE.search(error_msg.lower())
         self.assertTrue(
-            any(f"column {i}" in error_msg.lower() for i in range(9, 13)),
+            match and 9 <= int(match.group(1)) <= 12,
             f"Error message should include column number around 10-12. Got: {error_msg}"
         )
     
@@ -135,18 +129,16 @@ class TestTokenizerSpecialCases(unittest.TestCase):
     
     def test_unterminated_string(self):
         """Test error reporting for unterminated string literals."""
-        try:
-            with self.assertRaises(Exception) as cm:
-                tokenize('var s = "unterminated')
-                
-            error_msg = str(cm.exception)
-            # Check for relevant error terms
-            terms = ["unterminated", "string", "unexpected", "end", "quote"]
-            found = any(term in error_msg.lower() for term in terms)
-            self.assertTrue(found, f"Error message should mention unterminated string: {error_msg}")
-        except AssertionError:
-            # Skip this test if the tokenizer doesn't catch unterminated strings
-            self.skipTest("Tokenizer doesn't catch unterminated strings")
+        with self.assertRaises(Exception) as cm:
+            tokenize('var s = "unterminated')
+            
+        error_msg_lower = str(cm.exception).lower()
+        # Check for relevant error terms
+        terms = ["unterminated", "string", "unexpected", "end", "quote"]
+        found = any(term in error_msg_lower for term in terms)
+        self.assertTrue(found, f"Error message should mention unterminated string: {cm.exception}")
+        # Reported at the opening quote
+        self.assertIn("column 9", error_msg_lower)
     
     def test_tokenizer_stops_at_first_error(self):
         """Test that tokenizer stops at the first error."""
@@ -0,0 +1,31 @@
+import unittest
+from src.parser import _unescape
+
+
+class TestUnescape(unittest.TestCase):
+    CASES = [
+        ("hello", "hello"),                    # nothing to unescape
+        (r"a\nb", "a\nb"),                     # newline
+        (r"a\tb", "a\tb"),                     # tab
+        (r"say \"hi\"", 'say "hi"'),           # escaped quote
+        (r"back\\slash", "back\\slash"),       # escaped backslash
+        (r"\\n", "\\n"),                       # backslash, then a plain 'n'
+    ]
+
+    def test_known_escapes(self):
+        """Test that known escape sequences are replaced"""
+        for source, expected in self.CASES:
+            with self.subTest(source=source):
+                self.assertEqual(_unescape(source), expected)
+
+    def test_unknown_escape(self):
+        """Test that an unknown escape keeps its backslash"""
+        self.assertEqual(_unescape(r"a\qb"), "a\\qb")
+
+    def test_trailing_backslash(self):
+        """Test that a backslash at the end of the text is kept as is"""
+        self.assertEqual(_unescape("abc\\"), "abc\\")
+
+
+if __name__ == '__main__':
+    unittest.main()
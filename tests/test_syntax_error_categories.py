@@ -13,8 +13,6 @@ This file contains tests for different categories of syntax errors:
 import unittest
 import os
 
-from src.tokenizer import tokenize
-from src.parser import Parser
 from tests.error_test_utils import ErrorReportingTestCase
 
 
@@ -29,15 +27,15 @@ class TestSyntaxErrorCategories(ErrorReportingTestCase):
             ["Unexpected character", "$"],
             1
         )
-        
-        # Unterminated string
-        # Note: This depends on tokenizer implementation; it might report different errors
-        try:
-            with self.assertRaises(Exception):
-                tokenize('var s = "unterminated')
-        except AssertionError:
-            # Skip this test if the tokenizer doesn't catch unterminated strings
-            pass
+    
+    def test_unterminated_string(self):
+        """Test that an unterminated string is a lexical error."""
+        # Reported as an unexpected character at the opening quote
+        self.assert_tokenize_error(
+            'var s = "unterminated',
+            ["Unexpected character", '"'],
+            1
+        )
     
     def test_expression_level_errors(self):
         """Test errors in expressions."""
@@ -122,13 +120,7 @@ def func() {
     var c = 30
 }'''
         
-        tokens = tokenize(code)
-        parser = Parser(tokens, filename="line_test.hdy")
-        
-        with self.assertRaises(Exception) as cm:
-            parser.parse()
-            
-        error_msg = str(cm.exception)
+        error_msg = self.parse_error_message(code, "line_test.hdy")
         self.assertIn(":5:", error_msg, "Error message should contain line number 5")
     
     def test_context_display(self):
@@ -140,13 +132,7 @@ def func() {
     var a = 30
 }'''
         
-        tokens = tokenize(code)
-        parser = Parser(tokens, filename="context_test.hdy")
-        
-        with self.assertRaises(Exception) as cm:
-            parser.parse()
-            
-        error_msg = str(cm.exception)
+        error_msg = self.parse_error_message(code, "context_test.hdy")
         
         # Should show the error line
         self.assertIn("var z = x + * y", error_msg)